@@ -2,117 +2,119 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
-from .modbus_server import DTSU666ModbusServer
+
+if TYPE_CHECKING:
+    from .modbus_server import DTSU666ModbusServer
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor"]
 
+_ENTRY_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("host"): vol.All(str, vol.Length(min=1)),
+        vol.Required("port"): vol.All(int, vol.Range(min=1, max=65535)),
+        vol.Required("slave_id"): vol.All(int, vol.Range(min=1, max=247)),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up DTSU666 Emulator from a config entry."""
+    # Validate configuration data
+    if not _validate_entry_data(entry):
+        return False
+
+    data = entry.data
+    options = entry.options
+    host = data["host"]
+    port = data["port"]
+
+    # Imported here so pymodbus is only loaded once an entry is actually set up
+    from .coordinator import DTSU666Coordinator
+    from .modbus_server import DTSU666ModbusServer
+
+    # Create and start the Modbus server
+    server = DTSU666ModbusServer(
+        hass=hass,
+        host=host,
+        port=port,
+        slave_id=data["slave_id"],
+        entity_mappings=data.get("entity_mappings", {}),
+        update_interval=options.get("update_interval", data.get("update_interval", 5)),
+    )
+
+    # start() logs and reports its own errors; the UDP bind itself happens later
+    # in the server task, so there is no network exception to catch here
+    if not await server.start():
+        _LOGGER.error("Failed to start DTSU666 Modbus server on %s:%d", host, port)
+        raise ConfigEntryNotReady("Failed to start Modbus server")
+
+    # Sensors share the snapshots the server pushes through one coordinator
+    coordinator = DTSU666Coordinator(hass, entry, server)
+    entry.async_on_unload(
+        server.async_add_update_listener(coordinator.async_handle_server_update)
+    )
+
+    # Store server and coordinator instances
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "server": server,
+        "coordinator": coordinator,
+    }
+
+    # Setup platforms, always leaving hass.data consistent with the server state
+    platforms_ready = False
     try:
-        # Validate configuration data
-        if not _validate_entry_data(entry):
-            return False
-            
-        # Create and start the Modbus server
-        server = DTSU666ModbusServer(
-            hass=hass,
-            host=entry.data["host"],
-            port=entry.data["port"],
-            slave_id=entry.data["slave_id"],
-            entity_mappings=entry.data.get("entity_mappings", {}),
-            update_interval=entry.options.get("update_interval", entry.data.get("update_interval", 5)),
-        )
-
-        if not await server.start():
-            _LOGGER.error("Failed to start DTSU666 Modbus server on %s:%d", 
-                         entry.data["host"], entry.data["port"])
-            raise ConfigEntryNotReady("Failed to start Modbus server")
-
-        # Store server instance
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = server
-
-        # Setup platforms with error handling
-        try:
-            await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        except Exception as ex:
-            _LOGGER.error("Failed to set up platforms: %s", ex)
+        # Done before forwarding: ConfigEntryNotReady must not come from a platform
+        await coordinator.async_config_entry_first_refresh()
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        platforms_ready = True
+    finally:
+        if not platforms_ready:
             await server.stop()
             hass.data[DOMAIN].pop(entry.entry_id, None)
-            return False
 
-        # Add update listener for configuration changes
-        entry.async_on_unload(entry.add_update_listener(async_update_options))
+    # Add update listener for configuration changes
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-        _LOGGER.info("DTSU666 Emulator integration setup completed successfully")
-        return True
-
-    except ConfigEntryNotReady:
-        raise  # Re-raise ConfigEntryNotReady without wrapping
-    except Exception as ex:
-        _LOGGER.error("Failed to setup DTSU666 Emulator: %s", ex, exc_info=True)
-        return False
+    _LOGGER.info("DTSU666 Emulator integration setup completed successfully")
+    return True
 
 
 def _validate_entry_data(entry: ConfigEntry) -> bool:
     """Validate configuration entry data."""
     try:
-        required_fields = ["host", "port", "slave_id"]
-        for field in required_fields:
-            if field not in entry.data:
-                _LOGGER.error("Missing required configuration field: %s", field)
-                return False
-                
-        # Validate data types and ranges
-        if not isinstance(entry.data["host"], str) or not entry.data["host"]:
-            _LOGGER.error("Invalid host configuration")
-            return False
-            
-        port = entry.data["port"]
-        if not isinstance(port, int) or not (1 <= port <= 65535):
-            _LOGGER.error("Invalid port configuration: %s", port)
-            return False
-            
-        slave_id = entry.data["slave_id"]
-        if not isinstance(slave_id, int) or not (1 <= slave_id <= 247):
-            _LOGGER.error("Invalid slave_id configuration: %s", slave_id)
-            return False
-            
+        _ENTRY_DATA_SCHEMA(dict(entry.data))
         return True
-        
-    except Exception as ex:
-        _LOGGER.error("Error validating entry data: %s", ex)
+    except vol.Invalid as ex:
+        _LOGGER.error("Invalid entry data: %s", ex)
         return False
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Stop the Modbus server
-    server: DTSU666ModbusServer = hass.data[DOMAIN][entry.entry_id]
-    await server.stop()
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is not None:
+        server: DTSU666ModbusServer = entry_data["server"]
+        await server.stop()
 
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
-
-
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options."""
     await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
@@ -23,10 +23,10 @@ from .const import (
     DOMAIN,
     ENTITY_MAPPING_TYPES,
     REQUIRED_ENTITIES,
+    REQUIRED_ENTITIES_SET,
 )
 from .utils import (
     get_device_class_for_entity,
-    is_valid_host,
     parse_entity_mappings,
     validate_entity_mappings,
     validate_network_settings,
@@ -34,6 +34,36 @@ from .utils import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static schemas and selectors are built once and reused on every form render
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
+    vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=65535)
+    ),
+    vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=247)
+    ),
+    vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=300)
+    ),
+})
+
+_ENTITY_SELECTORS = {
+    entity_type: selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain="sensor",
+            device_class=get_device_class_for_entity(entity_type),
+        )
+    )
+    for entity_type in ENTITY_MAPPING_TYPES
+}
+
+# (entity_type, form field key) pairs for the entity mapping forms
+_EM_FORM_KEYS = tuple(
+    (entity_type, f"{CONF_ENTITY_MAPPINGS}.{entity_type}")
+    for entity_type in ENTITY_MAPPING_TYPES
+)
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for DTSU666 Emulator."""
@@ -58,18 +88,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
-                vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=65535)
-                ),
-                vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=247)
-                ),
-                vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=300)
-                ),
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -92,18 +111,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Create schema for entity mapping
         entity_schema = {}
-        for entity_type in ENTITY_MAPPING_TYPES:
-            is_required = entity_type in REQUIRED_ENTITIES
+        for entity_type, form_key in _EM_FORM_KEYS:
+            is_required = entity_type in REQUIRED_ENTITIES_SET
             
             if is_required:
-                entity_schema[vol.Required(f"{CONF_ENTITY_MAPPINGS}.{entity_type}")] = selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class=get_device_class_for_entity(entity_type),
-                    )
-                )
+                entity_schema[vol.Required(form_key)] = _ENTITY_SELECTORS[entity_type]
             else:
-                entity_schema[vol.Optional(f"{CONF_ENTITY_MAPPINGS}.{entity_type}", default="")] = str
+                entity_schema[vol.Optional(form_key, default="")] = str
 
         return self.async_show_form(
             step_id="entities",
@@ -150,8 +164,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             errors = validate_network_settings(user_input)
             if not errors:
                 # Update config entry data
-                new_data = dict(self.config_entry.data)
-                new_data.update(user_input)
+                new_data = {**self.config_entry.data, **user_input}
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
@@ -187,22 +200,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             current_mappings = self.config_entry.data.get(CONF_ENTITY_MAPPINGS, {})
             entity_mappings = current_mappings.copy()
             
-            # Update with new form data
+            # Update with new form data; submitted but empty fields clear the mapping
             form_mappings = parse_entity_mappings(user_input)
-            for entity_type in ENTITY_MAPPING_TYPES:
-                form_key = f"{CONF_ENTITY_MAPPINGS}.{entity_type}"
-                if form_key in user_input:
-                    value = user_input[form_key]
-                    if value and value.strip():
-                        entity_mappings[entity_type] = value.strip()
-                    else:
-                        entity_mappings.pop(entity_type, None)
+            for entity_type, form_key in _EM_FORM_KEYS:
+                if entity_type in form_mappings:
+                    entity_mappings[entity_type] = form_mappings[entity_type]
+                elif form_key in user_input:
+                    entity_mappings.pop(entity_type, None)
             
             errors = validate_entity_mappings(self.hass, entity_mappings)
             if not errors:
                 # Update config entry data
-                new_data = dict(self.config_entry.data)
-                new_data[CONF_ENTITY_MAPPINGS] = entity_mappings
+                new_data = {**self.config_entry.data, CONF_ENTITY_MAPPINGS: entity_mappings}
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
@@ -211,19 +220,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Create schema for entity mapping
         current_mappings = self.config_entry.data.get(CONF_ENTITY_MAPPINGS, {})
         entity_schema = {}
-        for entity_type in ENTITY_MAPPING_TYPES:
-            is_required = entity_type in REQUIRED_ENTITIES
+        for entity_type, form_key in _EM_FORM_KEYS:
+            is_required = entity_type in REQUIRED_ENTITIES_SET
             current_value = current_mappings.get(entity_type, "")
             
             if is_required:
-                entity_schema[vol.Required(f"{CONF_ENTITY_MAPPINGS}.{entity_type}", default=current_value)] = selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class=get_device_class_for_entity(entity_type),
-                    )
-                )
+                entity_schema[vol.Required(form_key, default=current_value)] = _ENTITY_SELECTORS[entity_type]
             else:
-                entity_schema[vol.Optional(f"{CONF_ENTITY_MAPPINGS}.{entity_type}", default=current_value)] = str
+                entity_schema[vol.Optional(form_key, default=current_value)] = str
 
         return self.async_show_form(
             step_id="entities",
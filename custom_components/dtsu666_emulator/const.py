@@ -1,6 +1,8 @@
 """Constants for DTSU666 Emulator integration."""
 from __future__ import annotations
 
+from typing import NamedTuple
+
 DOMAIN = "dtsu666_emulator"
 
 # Configuration keys
@@ -16,51 +18,71 @@ DEFAULT_PORT = 5020
 DEFAULT_SLAVE_ID = 11
 DEFAULT_UPDATE_INTERVAL = 5
 
+
+class RegisterInfo(NamedTuple):
+    """Static description of a DTSU666 Modbus register."""
+
+    addr: int
+    scale: float
+    unit: str
+
+
 # Modbus register mappings based on DTSU666 specification
 # Addresses and scales from jsphuebner/dtsu666-Emulator
-REGISTER_MAP = {
+REGISTER_MAP: dict[str, RegisterInfo] = {
     # Voltage measurements (Line-to-Line)
-    "voltage_l1_l2": {"addr": 0x1836, "scale": 0.1, "unit": "V"},
-    "voltage_l2_l3": {"addr": 0x1838, "scale": 0.1, "unit": "V"},
-    "voltage_l3_l1": {"addr": 0x183A, "scale": 0.1, "unit": "V"},
+    "voltage_l1_l2": RegisterInfo(0x1836, 0.1, "V"),
+    "voltage_l2_l3": RegisterInfo(0x1838, 0.1, "V"),
+    "voltage_l3_l1": RegisterInfo(0x183A, 0.1, "V"),
     
     # Voltage measurements (Line-to-Neutral)  
-    "voltage_l1": {"addr": 0x183C, "scale": 0.1, "unit": "V"},
-    "voltage_l2": {"addr": 0x183E, "scale": 0.1, "unit": "V"},
-    "voltage_l3": {"addr": 0x1840, "scale": 0.1, "unit": "V"},
+    "voltage_l1": RegisterInfo(0x183C, 0.1, "V"),
+    "voltage_l2": RegisterInfo(0x183E, 0.1, "V"),
+    "voltage_l3": RegisterInfo(0x1840, 0.1, "V"),
     
     # Current measurements
-    "current_l1": {"addr": 0x836, "scale": 0.001, "unit": "A"},
-    "current_l2": {"addr": 0x838, "scale": 0.001, "unit": "A"},
-    "current_l3": {"addr": 0x83A, "scale": 0.001, "unit": "A"},
-    "current_neutral": {"addr": 0x83C, "scale": 0.001, "unit": "A"},
+    "current_l1": RegisterInfo(0x836, 0.001, "A"),
+    "current_l2": RegisterInfo(0x838, 0.001, "A"),
+    "current_l3": RegisterInfo(0x83A, 0.001, "A"),
+    "current_neutral": RegisterInfo(0x83C, 0.001, "A"),
     
     # Power measurements (Active)
-    "power_l1": {"addr": 0x84A, "scale": 0.001, "unit": "kW"},
-    "power_l2": {"addr": 0x84C, "scale": 0.001, "unit": "kW"},
-    "power_l3": {"addr": 0x84E, "scale": 0.001, "unit": "kW"},
-    "power_total": {"addr": 0x850, "scale": 0.001, "unit": "kW"},
+    "power_l1": RegisterInfo(0x84A, 0.001, "kW"),
+    "power_l2": RegisterInfo(0x84C, 0.001, "kW"),
+    "power_l3": RegisterInfo(0x84E, 0.001, "kW"),
+    "power_total": RegisterInfo(0x850, 0.001, "kW"),
     
     # Power measurements (Reactive)
-    "reactive_power_l1": {"addr": 0x852, "scale": 0.001, "unit": "kVAr"},
-    "reactive_power_l2": {"addr": 0x854, "scale": 0.001, "unit": "kVAr"},
-    "reactive_power_l3": {"addr": 0x856, "scale": 0.001, "unit": "kVAr"},
-    "reactive_power_total": {"addr": 0x858, "scale": 0.001, "unit": "kVAr"},
+    "reactive_power_l1": RegisterInfo(0x852, 0.001, "kVAr"),
+    "reactive_power_l2": RegisterInfo(0x854, 0.001, "kVAr"),
+    "reactive_power_l3": RegisterInfo(0x856, 0.001, "kVAr"),
+    "reactive_power_total": RegisterInfo(0x858, 0.001, "kVAr"),
     
     # Power factor
-    "power_factor_l1": {"addr": 0x85A, "scale": 0.001, "unit": ""},
-    "power_factor_l2": {"addr": 0x85C, "scale": 0.001, "unit": ""},
-    "power_factor_l3": {"addr": 0x85E, "scale": 0.001, "unit": ""},
-    "power_factor_total": {"addr": 0x860, "scale": 0.001, "unit": ""},
+    "power_factor_l1": RegisterInfo(0x85A, 0.001, ""),
+    "power_factor_l2": RegisterInfo(0x85C, 0.001, ""),
+    "power_factor_l3": RegisterInfo(0x85E, 0.001, ""),
+    "power_factor_total": RegisterInfo(0x860, 0.001, ""),
     
     # Energy measurements
-    "energy_import_total": {"addr": 0x862, "scale": 0.01, "unit": "kWh"},
-    "energy_export_total": {"addr": 0x864, "scale": 0.01, "unit": "kWh"},
+    "energy_import_total": RegisterInfo(0x862, 0.01, "kWh"),
+    "energy_export_total": RegisterInfo(0x864, 0.01, "kWh"),
     
     # System parameters
-    "frequency": {"addr": 0x866, "scale": 0.01, "unit": "Hz"},
+    "frequency": RegisterInfo(0x866, 0.01, "Hz"),
 }
 
+# Set of register names for membership tests
+REGISTER_NAMES = frozenset(REGISTER_MAP)
+
+# Stable position of each register in REGISTER_MAP order, used for tuple snapshots
+REGISTER_INDEX = {name: index for index, name in enumerate(REGISTER_MAP)}
+
+# (name, address, 1/scale) per register, precomputed so register writes use a multiply
+REGISTER_TABLE = tuple(
+    (name, info.addr, 1.0 / info.scale) for name, info in REGISTER_MAP.items()
+)
+
 # Entity mapping types
 ENTITY_MAPPING_TYPES = [
     "voltage_l1",
@@ -87,6 +109,9 @@ REQUIRED_ENTITIES = [
     "frequency",
 ]
 
+# Set view of REQUIRED_ENTITIES for membership tests (the list keeps display order)
+REQUIRED_ENTITIES_SET = frozenset(REQUIRED_ENTITIES)
+
 # Default values for unmapped entities (0 for no load, realistic grid values for system params)
 DEFAULT_VALUES = {
     # Voltage measurements (0V = no measurement, will use mapped voltage_l1 for calculations)
@@ -0,0 +1,41 @@
+"""Data update coordinator for DTSU666 Emulator sensors."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+from .modbus_server import DTSU666ModbusServer, RegisterSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DTSU666Coordinator(DataUpdateCoordinator[RegisterSnapshot]):
+    """Share the server's published register snapshot with all sensors."""
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, server: DTSU666ModbusServer
+    ) -> None:
+        """Initialize the coordinator."""
+        # No polling: the server pushes each snapshot it publishes
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name=DOMAIN,
+            update_interval=None,
+            always_update=False,
+        )
+        self.server = server
+
+    async def _async_update_data(self) -> RegisterSnapshot:
+        """Return the latest published register snapshot."""
+        return self.server.snapshot
+
+    @callback
+    def async_handle_server_update(self) -> None:
+        """Push the snapshot the server just published to the sensors."""
+        self.async_set_updated_data(self.server.snapshot)
@@ -3,17 +3,85 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import threading
+import math
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple
 
 from pymodbus.datastore import ModbusSequentialDataBlock, ModbusSlaveContext, ModbusServerContext
 from pymodbus.device import ModbusDeviceIdentification
-from pymodbus.server import StartUdpServer
+from pymodbus.server import ModbusUdpServer
+
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+
+from .const import (
+    DEFAULT_VALUES,
+    REGISTER_INDEX,
+    REGISTER_MAP,
+    REGISTER_NAMES,
+    REGISTER_TABLE,
+    REQUIRED_ENTITIES,
+    REQUIRED_ENTITIES_SET,
+)
 
-from homeassistant.core import HomeAssistant
+_LOGGER = logging.getLogger(__name__)
 
-from .const import REGISTER_MAP, DEFAULT_VALUES, REQUIRED_ENTITIES
 
-_LOGGER = logging.getLogger(__name__)
+def _build_register_runs() -> tuple[tuple[int, int, tuple[tuple[str, int, int, float, bool], ...]], ...]:
+    """Group registers into runs of adjacent 2-word slots.
+
+    Each run is (base_address, length, registers) so a whole run can be
+    written with a single setValues call. Registers are
+    (name, index, address, inv_scale, is_energy) where index is the
+    REGISTER_INDEX position and is_energy selects the unsigned energy clamp.
+    """
+    runs: list[list[tuple[str, int, int, float, bool]]] = []
+    registers = [
+        (name, index, address, inv_scale, "energy" in name)
+        for index, (name, address, inv_scale) in enumerate(REGISTER_TABLE)
+    ]
+    for register in sorted(registers, key=lambda register: register[2]):
+        if runs and register[2] - runs[-1][-1][2] <= 2:
+            runs[-1].append(register)
+        else:
+            runs.append([register])
+    return tuple(
+        (run[0][2], run[-1][2] - run[0][2] + 1, tuple(run)) for run in runs
+    )
+
+
+_REGISTER_RUNS = _build_register_runs()
+
+# Address span covering every register's 2-word slot, cleared on meter failure
+_WIPE_BASE = min(info.addr for info in REGISTER_MAP.values())
+_WIPE_LEN = max(info.addr for info in REGISTER_MAP.values()) + 2 - _WIPE_BASE
+# Shared zero fill for that span; setValues copies it into the block, so it is never mutated
+_WIPE_ZEROS = [0] * _WIPE_LEN
+
+
+class RegisterSnapshot(NamedTuple):
+    """Register values published by one update, indexed by REGISTER_INDEX."""
+
+    seq: int
+    values: tuple[float | None, ...]
+    raw_values: tuple[int | None, ...]
+
+
+# Values published while no register holds a value (startup, meter failure)
+_EMPTY_VALUES: tuple[None, ...] = (None,) * len(REGISTER_INDEX)
+
+# Registers that _calculate_derived_values may fill in when left at their default
+_DERIVED_REGISTERS = frozenset({"power_factor_total"})
+
+# Consecutive failed updates after which register updates are stopped
+_MAX_UPDATE_ERRORS = 10
+
+# Interval after which every register run is rewritten even if nothing changed, so
+# values written by a Modbus client into the shared data block do not persist
+_FULL_REWRITE_SECONDS = 60
 
 
 class DTSU666ModbusServer:
@@ -36,14 +104,40 @@ class DTSU666ModbusServer:
         self.entity_mappings = entity_mappings
         self.update_interval = update_interval
         self._server_task: asyncio.Task | None = None
-        self._update_task: asyncio.Task | None = None
+        self._unsub_update: Callable[[], None] | None = None
+        self._unsub_state_listener: Callable[[], None] | None = None
+        # Latest state of each mapped entity, pushed by the state change listener
+        self._latest_states: dict[str, State | None] = {}
+        self._dirty = True
+        # Ticks are counted rather than timed since the timer already paces them
+        self._full_rewrite_ticks = max(1, _FULL_REWRITE_SECONDS // update_interval)
+        self._ticks_until_rewrite = self._full_rewrite_ticks
+        self._update_error_count = 0
         self._data_block: ModbusSequentialDataBlock | None = None
         self._running = False
-        self._current_values: dict[str, float] = {}
-        self._raw_register_values: dict[str, int] = {}
+        # Immutable snapshot, replaced as a whole and announced to listeners on update
+        self._snapshot = RegisterSnapshot(0, _EMPTY_VALUES, _EMPTY_VALUES)
+        self._update_listeners: list[Callable[[], None]] = []
+        self._values: dict[str, float] = dict(DEFAULT_VALUES)
+        self._last_payloads: dict[int, list[int]] = {}
+        self._float_cache: dict[str, tuple[str, float | None]] = {}
+        self._reset_registers = tuple(
+            register_name
+            for register_name in DEFAULT_VALUES
+            if register_name in entity_mappings or register_name in _DERIVED_REGISTERS
+        )
+        # Mappings never change for the server's lifetime, so filter them once
+        self._active_mappings = tuple(
+            (register_name, entity_id, register_name in REQUIRED_ENTITIES_SET)
+            for register_name, entity_id in entity_mappings.items()
+            if entity_id and register_name in REGISTER_NAMES
+        )
+        self._unmapped_required = tuple(
+            entity_type for entity_type in REQUIRED_ENTITIES
+            if not entity_mappings.get(entity_type)
+        )
         self._meter_failed = False
-        self._server = None
-        self._state_lock = threading.RLock()
+        self._server: ModbusUdpServer | None = None
 
     async def start(self) -> bool:
         """Start the Modbus server."""
@@ -71,8 +165,22 @@ class DTSU666ModbusServer:
             # Create server task with error handling
             self._server_task = asyncio.create_task(self._run_server_with_recovery(context, identity))
 
-            # Start periodic updates with error handling
-            self._update_task = asyncio.create_task(self._periodic_update())
+            # Track mapped entities so updates only do work after a state change
+            entity_ids = [entity_id for _, entity_id, _ in self._active_mappings]
+            self._latest_states = {
+                entity_id: self.hass.states.get(entity_id) for entity_id in entity_ids
+            }
+            self._dirty = True
+            if entity_ids:
+                self._unsub_state_listener = async_track_state_change_event(
+                    self.hass, entity_ids, self._async_on_state_change
+                )
+
+            # Start periodic updates on HA's timer and populate the registers right away
+            self._unsub_update = async_track_time_interval(
+                self.hass, self._async_on_tick, timedelta(seconds=self.update_interval)
+            )
+            self._async_on_tick()
             
             _LOGGER.info(
                 "DTSU666 Modbus server started on %s:%d (slave ID: %d)",
@@ -133,28 +241,17 @@ class DTSU666ModbusServer:
         
         while self._running and retry_count < max_retries:
             try:
-                # Use the correct async approach for pymodbus
-                from pymodbus.server.async_io import StartAsyncUdpServer
-                
-                self._server = await StartAsyncUdpServer(
+                # Keep a handle on the server object so stop() can shut it down cleanly
+                self._server = ModbusUdpServer(
                     context=context,
                     identity=identity,
                     address=(self.host, self.port),
-                    custom_functions=[],
                 )
-                
-                _LOGGER.info("Modbus UDP server started successfully on %s:%d", self.host, self.port)
-                
-                # Keep the server running
-                while self._running:
-                    await asyncio.sleep(1)
-                    
-                break  # Server started successfully
-                
-            except ImportError:
-                # Fallback for older pymodbus versions
-                _LOGGER.warning("StartAsyncUdpServer not available, using threaded approach")
-                await self._run_threaded_server(context, identity)
+
+                _LOGGER.info("Modbus UDP server starting on %s:%d", self.host, self.port)
+
+                # Serves requests until shutdown() is called
+                await self._server.serve_forever()
                 break
                 
             except OSError as ex:
@@ -175,42 +272,18 @@ class DTSU666ModbusServer:
                 
         if retry_count >= max_retries:
             _LOGGER.error("Failed to start server after %d attempts", max_retries)
-            self._running = False
-            
-    async def _run_threaded_server(
-        self,
-        context: ModbusServerContext,
-        identity: ModbusDeviceIdentification
-    ) -> None:
-        """Run server in a thread to avoid event loop conflicts."""
-        import threading
-        from pymodbus.server import StartUdpServer
-        
-        def run_server():
-            try:
-                StartUdpServer(
-                    context=context,
-                    identity=identity,
-                    address=(self.host, self.port),
-                    custom_functions=[],
-                )
-            except Exception as ex:
-                _LOGGER.error("Error in threaded server: %s", ex)
-        
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-        
-        # Wait for server to be ready
-        await asyncio.sleep(1)
-        _LOGGER.info("Modbus UDP server started in background thread on %s:%d", self.host, self.port)
+
+        # Leaving the loop means nothing is serving any more, whatever the reason,
+        # so stop feeding registers that no client can read
+        self._running = False
+        self._cancel_periodic_update()
+        # Subscribers only refresh on notification, so announce that the server is down
+        self._notify_update_listeners()
             
     async def _cleanup_on_error(self) -> None:
         """Clean up resources on startup error."""
         self._running = False
-        
-        if self._update_task:
-            self._update_task.cancel()
-            self._update_task = None
+        self._cancel_periodic_update()
             
         if self._server_task:
             self._server_task.cancel() 
@@ -219,282 +292,342 @@ class DTSU666ModbusServer:
     async def stop(self) -> None:
         """Stop the Modbus server."""
         self._running = False
-        
-        if self._update_task:
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
+        self._cancel_periodic_update()
 
-        if self._server_task:
-            self._server_task.cancel()
-            try:
-                await self._server_task
-            except asyncio.CancelledError:
-                pass
-                
-        # Stop the pymodbus server if it exists
-        if hasattr(self, '_server') and self._server:
+        # Stop the pymodbus server; serve_forever() returns once it is shut down
+        if self._server:
             try:
                 await self._server.shutdown()
                 _LOGGER.info("Modbus server shutdown completed")
             except Exception as ex:
                 _LOGGER.warning("Error shutting down server: %s", ex)
+            self._server = None
 
-        _LOGGER.info("DTSU666 Modbus server stopped")
-
-    async def _periodic_update(self) -> None:
-        """Periodically update Modbus registers from HA entities."""
-        error_count = 0
-        max_errors = 10
-        backoff_delay = self.update_interval
-        
-        while self._running:
-            try:
-                await self._update_registers()
-                # Reset error tracking on successful update
-                error_count = 0
-                backoff_delay = self.update_interval
-                await asyncio.sleep(self.update_interval)
-                
-            except asyncio.CancelledError:
-                _LOGGER.debug("Periodic update task cancelled")
-                break
-                
-            except Exception as ex:
-                error_count += 1
-                _LOGGER.error("Error updating registers (attempt %d/%d): %s", 
-                            error_count, max_errors, ex)
-                
-                # Implement exponential backoff for repeated errors
-                if error_count >= max_errors:
-                    _LOGGER.error("Too many consecutive errors, stopping register updates")
-                    break
-                    
-                backoff_delay = min(backoff_delay * 1.5, 60)  # Max 60 second delay
-                _LOGGER.warning("Using backoff delay of %.1f seconds", backoff_delay)
-                
+        if self._server_task:
+            # Only cancel if the server task did not finish after shutdown
+            _, pending = await asyncio.wait({self._server_task}, timeout=5)
+            if pending:
+                self._server_task.cancel()
                 try:
-                    await asyncio.sleep(backoff_delay)
+                    await self._server_task
                 except asyncio.CancelledError:
-                    break
+                    pass
+            self._server_task = None
+
+        _LOGGER.info("DTSU666 Modbus server stopped")
+
+    def _cancel_periodic_update(self) -> None:
+        """Stop the periodic register update timer and the state listener feeding it."""
+        if self._unsub_update:
+            self._unsub_update()
+            self._unsub_update = None
+
+        if self._unsub_state_listener:
+            self._unsub_state_listener()
+            self._unsub_state_listener = None
+
+    @callback
+    def _async_on_state_change(self, event: Event) -> None:
+        """Record the new state of a mapped entity for the next register update."""
+        self._latest_states[event.data["entity_id"]] = event.data["new_state"]
+        self._dirty = True
+
+    @callback
+    def _async_on_tick(self, now: datetime | None = None) -> None:
+        """Schedule a register update from the periodic timer."""
+        self._ticks_until_rewrite -= 1
+        if self._ticks_until_rewrite <= 0:
+            # Forget what was written so the next update rewrites every run
+            self._ticks_until_rewrite = self._full_rewrite_ticks
+            self._last_payloads.clear()
+            self._dirty = True
+
+        # Nothing to recompute unless a mapped entity changed since the last update
+        if not self._dirty:
+            return
+
+        # Updates normally finish without suspending, so run them eagerly
+        self.hass.async_create_task(self._async_periodic_update(), eager_start=True)
+
+    async def _async_periodic_update(self) -> None:
+        """Update Modbus registers from HA entities, tracking consecutive errors."""
+        if not self._running:
+            return
+
+        try:
+            await self._update_registers()
+        except Exception as ex:
+            # Retry on the next tick even if no entity changes in the meantime
+            self._dirty = True
+            self._update_error_count += 1
+            _LOGGER.error("Error updating registers (attempt %d/%d): %s", 
+                        self._update_error_count, _MAX_UPDATE_ERRORS, ex)
+
+            if self._update_error_count >= _MAX_UPDATE_ERRORS:
+                _LOGGER.error("Too many consecutive errors, stopping register updates")
+                self._cancel_periodic_update()
+        else:
+            # Reset error tracking on successful update
+            self._update_error_count = 0
 
     async def _update_registers(self) -> None:
         """Update Modbus registers with current entity values."""
         if not self._data_block:
             return
 
-        # Check if any required entities are unavailable
-        meter_should_fail = self._check_meter_health()
-        
-        with self._state_lock:
-            if meter_should_fail:
-                if not self._meter_failed:
-                    _LOGGER.warning("Meter simulation failed - required entities unavailable")
-                    self._meter_failed = True
-                    # Stop responding to Modbus requests by clearing all registers
-                    await self._simulate_meter_failure()
-                return
-            else:
-                if self._meter_failed:
-                    _LOGGER.info("Meter simulation recovered - entities now available")
-                    self._meter_failed = False
-                    await self._restore_meter_values()
+        self._dirty = False
 
-        # Get all values (mapped + defaults + calculated)
-        all_values = self._get_all_register_values()
+        # Read every mapped entity once: values (mapped + defaults) and meter health
+        all_values, meter_should_fail = self._collect_register_values()
         
-        # Update all registers
-        for register_name, value in all_values.items():
-            self._update_single_register(register_name, value)
-    
-    async def _restore_meter_values(self) -> None:
-        """Restore meter values after recovery from failure."""
-        _LOGGER.debug("Restoring meter values after failure recovery")
-        # Force immediate update of all register values
-        all_values = self._get_all_register_values()
-        for register_name, value in all_values.items():
-            self._update_single_register(register_name, value)
-
-    def _update_single_register(self, register_name: str, value: float) -> None:
-        """Update a single Modbus register with proper scaling and bounds checking."""
-        if not self._data_block or register_name not in REGISTER_MAP:
+        if meter_should_fail:
+            if not self._meter_failed:
+                _LOGGER.warning("Meter simulation failed - required entities unavailable")
+                self._meter_failed = True
+                # Stop responding to Modbus requests by clearing all registers
+                await self._simulate_meter_failure()
+            elif self._data_block:
+                # Clear again over anything a client wrote since (this also runs
+                # on the periodic full rewrite); the published snapshot stays empty
+                self._data_block.setValues(_WIPE_BASE, _WIPE_ZEROS)
             return
+        else:
+            if self._meter_failed:
+                _LOGGER.info("Meter simulation recovered - entities now available")
+                self._meter_failed = False
 
-        try:
-            register_info = REGISTER_MAP[register_name]
-            address = register_info["addr"]
-            scale = register_info["scale"]
-
-            # Apply scaling: raw_value = actual_value / scale
-            # Example: 230V with scale 0.1 becomes 2300 in register
-            raw_value = value / scale if scale != 0 else 0
-            
-            # Convert to integer and handle bounds
-            scaled_value = int(round(raw_value))
-            
-            # Handle energy registers specially - they have 16-bit limits
-            if "energy" in register_name:
-                if scaled_value > 32767:
-                    scaled_value = 32767
-                    _LOGGER.debug("Energy value %s (%.1f kWh) exceeds 16-bit limit, clamped to 327.67 kWh", 
-                                register_name, value)
-                elif scaled_value < 0:
-                    scaled_value = 0  # Energy can't be negative
-            else:
-                # Handle negative values with two's complement for 16-bit signed
-                if scaled_value < 0:
-                    scaled_value = max(-32768, scaled_value)  # Min signed 16-bit
-                    scaled_value = (1 << 16) + scaled_value
-                else:
-                    scaled_value = min(32767, scaled_value)  # Max signed 16-bit
-            
-            # Ensure final value is in 16-bit unsigned range
-            scaled_value = scaled_value & 0xFFFF
+        # Add calculated values and update all registers
+        self._calculate_derived_values(all_values)
+        self._write_registers(all_values)
 
-            # Write to Modbus register
-            self._data_block.setValues(address, [scaled_value])
-            
-            with self._state_lock:
-                self._current_values[register_name] = value
-                self._raw_register_values[register_name] = scaled_value
-            
-            _LOGGER.debug(
-                "Updated register %s (0x%04X): %.3f -> %d (scale: %.3f)",
-                register_name, address, value, scaled_value, scale
-            )
+    def _write_registers(self, values: dict[str, float]) -> None:
+        """Write register values with one setValues call per contiguous address run."""
+        if not self._data_block:
+            return
 
-        except Exception as ex:
-            _LOGGER.error("Error updating register %s with value %s: %s", 
-                         register_name, value, ex)
-
-    def _check_meter_health(self) -> bool:
-        """Check if meter should fail due to unavailable required entities."""
-        for required_entity_type in REQUIRED_ENTITIES:
-            entity_id = self.entity_mappings.get(required_entity_type)
-            if not entity_id:
-                _LOGGER.debug("Required entity %s is not mapped", required_entity_type)
-                return True
-                
-            state = self.hass.states.get(entity_id)
-            if not state or state.state in ("unknown", "unavailable"):
-                _LOGGER.debug("Required entity %s (%s) is unavailable", required_entity_type, entity_id)
-                return True
-                
-            try:
-                float(state.state)
-            except (ValueError, TypeError):
-                _LOGGER.debug("Required entity %s (%s) has invalid value: %s", 
-                            required_entity_type, entity_id, state.state)
-                return True
-        
-        return False
+        snapshot = self._snapshot
+        current_values = list(snapshot.values)
+        raw_values = list(snapshot.raw_values)
+        # Checked once per update so disabled debug logging costs nothing per register
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Local aliases keep attribute and global lookups out of the per-register loop
+        get_value = values.get
+        scale_value = self._scale_register_value
+        set_values = self._data_block.setValues
+        last_payloads = self._last_payloads
+
+        for base_address, length, registers in _REGISTER_RUNS:
+            # Padding words between the 2-word register slots stay zero
+            payload = [0] * length
+            for register_name, index, address, inv_scale, is_energy in registers:
+                value = get_value(register_name)
+                # Keep the previous register content when there is no usable new value
+                scaled_value = raw_values[index] or 0
+                if value is not None:
+                    try:
+                        scaled_value = scale_value(register_name, inv_scale, value, is_energy)
+                    except (ValueError, OverflowError) as ex:
+                        _LOGGER.error("Error updating register %s with value %s: %s",
+                                     register_name, value, ex)
+                    else:
+                        current_values[index] = value
+                        raw_values[index] = scaled_value
+                        if debug:
+                            _LOGGER.debug(
+                                "Updated register %s (0x%04X): %.3f -> %d (scale: %.3f)",
+                                register_name, address, value, scaled_value, 1.0 / inv_scale
+                            )
+                payload[address - base_address] = scaled_value
+
+            # Write the whole run at once, skipping runs whose content is unchanged
+            if last_payloads.get(base_address) != payload:
+                set_values(base_address, payload)
+                last_payloads[base_address] = payload
+
+        # Only announce updates that changed what the registers report
+        current_values = tuple(current_values)
+        raw_values = tuple(raw_values)
+        if current_values != snapshot.values or raw_values != snapshot.raw_values:
+            self._publish(current_values, raw_values)
+
+    def _publish(
+        self, values: tuple[float | None, ...], raw_values: tuple[int | None, ...]
+    ) -> None:
+        """Replace the register snapshot in one rebinding and notify update listeners."""
+        self._snapshot = RegisterSnapshot(self._snapshot.seq + 1, values, raw_values)
+        self._notify_update_listeners()
+
+    def _notify_update_listeners(self) -> None:
+        """Tell update listeners that the snapshot or the running state changed."""
+        for listener in self._update_listeners:
+            listener()
+
+    @callback
+    def async_add_update_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after every published snapshot and when the server stops serving.
+
+        Returns a function that removes the listener again.
+        """
+        self._update_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._update_listeners.remove(listener)
+
+        return remove_listener
+
+    @staticmethod
+    def _scale_register_value(
+        register_name: str, inv_scale: float, value: float, is_energy: bool
+    ) -> int:
+        """Convert a value to its 16-bit register representation with bounds checking."""
+        # Apply scaling: raw_value = actual_value / scale
+        # Example: 230V with scale 0.1 becomes 2300 in register
+        raw_value = value * inv_scale
+
+        # Convert to integer, rounding half away from zero without calling round()
+        scaled_value = int(raw_value + 0.5 if raw_value >= 0 else raw_value - 0.5)
+
+        # Handle energy registers specially - they have 16-bit limits
+        if is_energy:
+            if scaled_value > 32767:
+                scaled_value = 32767
+                _LOGGER.debug("Energy value %s (%.1f kWh) exceeds 16-bit limit, clamped to 327.67 kWh", 
+                            register_name, value)
+            elif scaled_value < 0:
+                scaled_value = 0  # Energy can't be negative
+        elif scaled_value > 32767 or scaled_value < -32768:
+            # Saturate to the signed 16-bit range; in-range values need no check
+            scaled_value = 32767 if scaled_value > 0 else -32768
+
+        # Masking yields the 16-bit two's complement form of negative values
+        return scaled_value & 0xFFFF
 
     async def _simulate_meter_failure(self) -> None:
         """Simulate meter failure by clearing all registers or stopping server."""
         if self._data_block:
             # Clear all registers to simulate meter not responding
-            for register_info in REGISTER_MAP.values():
-                address = register_info["addr"]
-                self._data_block.setValues(address, [0])
+            self._data_block.setValues(_WIPE_BASE, _WIPE_ZEROS)
             
-            with self._state_lock:
-                self._current_values.clear()
-                self._raw_register_values.clear()
+            self._publish(_EMPTY_VALUES, _EMPTY_VALUES)
+            # Registers were wiped, so the next update must rewrite every run
+            self._last_payloads.clear()
+
+    def _collect_register_values(self) -> tuple[dict[str, float], bool]:
+        """Collect mapped entity values and check required entity health in one pass.
+
+        Returns the server's reusable value buffer (defaults overridden by mapped
+        entity values) and whether the meter should fail because a required entity
+        is unmapped, unavailable or not numeric.
+        """
+        values = self._values
+        get_state = self._latest_states.get
+        float_cache = self._float_cache
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        meter_should_fail = False
+
+        for required_entity_type in self._unmapped_required:
+            if debug:
+                _LOGGER.debug("Required entity %s is not mapped", required_entity_type)
+            meter_should_fail = True
 
-    def _get_all_register_values(self) -> dict[str, float]:
-        """Get all register values combining mapped entities, defaults, and calculated values."""
-        values = {}
-        
-        # Start with default values
-        values.update(DEFAULT_VALUES)
+        # Only mapped and derived registers can differ from their defaults
+        for register_name in self._reset_registers:
+            values[register_name] = DEFAULT_VALUES[register_name]
         
         # Override with mapped entity values where available
-        for register_name, entity_id in self.entity_mappings.items():
-            if not entity_id or register_name not in REGISTER_MAP:
+        for register_name, entity_id, required in self._active_mappings:
+            state = get_state(entity_id)
+            if not state or state.state in ("unknown", "unavailable"):
+                if required:
+                    if debug:
+                        _LOGGER.debug("Required entity %s (%s) is unavailable", register_name, entity_id)
+                    meter_should_fail = True
                 continue
-                
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unknown", "unavailable"):
+
+            # Numeric states often repeat the exact same string across ticks, even
+            # when HA writes a new State object, so reuse the last parse on a match
+            state_str = state.state
+            cached = float_cache.get(entity_id)
+            if cached is not None and cached[0] == state_str:
+                value = cached[1]
+            else:
                 try:
-                    value = float(state.state)
-                    values[register_name] = value
-                    _LOGGER.debug("Using mapped value for %s: %s from %s", register_name, value, entity_id)
+                    value = float(state_str)
                 except (ValueError, TypeError):
+                    value = None
+                float_cache[entity_id] = (state_str, value)
+
+            if value is None:
+                if required:
+                    if debug:
+                        _LOGGER.debug("Required entity %s (%s) has invalid value: %s", 
+                                    register_name, entity_id, state.state)
+                    meter_should_fail = True
+                else:
                     _LOGGER.warning("Invalid numeric value for %s: %s", entity_id, state.state)
-        
-        # Calculate derived values
-        values = self._calculate_derived_values(values)
-        
-        return values
-
-    def _calculate_derived_values(self, values: dict[str, float]) -> dict[str, float]:
-        """Calculate derived values from basic measurements."""
-        derived = values.copy()
+                continue
 
-        # Get reference values for calculations
-        reference_voltage = derived.get("voltage_l1", 0.0)
-        total_power = derived.get("power_total", 0.0)
-        
-        # Calculate voltage-related values
-        if reference_voltage > 0:
-            self._calculate_voltage_derivatives(derived, reference_voltage)
-        
-        # Calculate power-related values  
-        if total_power > 0:
-            self._calculate_power_derivatives(derived, total_power)
-            
-        # Calculate currents from power and voltage
-        self._calculate_currents(derived)
-        
-        # Calculate power factor
-        self._calculate_power_factor(derived)
-
-        return derived
-
-    def _calculate_voltage_derivatives(self, derived: dict[str, float], reference_voltage: float) -> None:
-        """Calculate voltage derivatives only for mapped entities."""
-        # Only calculate line-to-line voltages if they are explicitly mapped
-        # Unmapped phases should remain 0
-        pass
-
-    def _calculate_power_derivatives(self, derived: dict[str, float], total_power: float) -> None:
-        """Calculate individual phase powers only for mapped entities."""
-        # Only distribute power to explicitly mapped phases
-        # Unmapped phases should remain 0
-        pass
-
-    def _calculate_currents(self, derived: dict[str, float]) -> None:
-        """Calculate currents only for explicitly mapped power and voltage entities."""
-        # Only calculate currents where both power AND voltage are explicitly mapped
-        # If either is unmapped (default 0), current should remain 0
-        pass
-
-    def _calculate_power_factor(self, derived: dict[str, float]) -> None:
-        """Calculate power factor from active and reactive power."""
-        active_power = derived.get("power_total", 0)
-        reactive_power = derived.get("reactive_power_total", 0)
+            values[register_name] = value
+            if debug:
+                _LOGGER.debug("Using mapped value for %s: %s from %s", register_name, value, entity_id)
         
-        if active_power > 0 and derived.get("power_factor_total", 0) == 0:
-            if reactive_power != 0:
-                apparent_power = (active_power**2 + reactive_power**2)**0.5
-                if apparent_power > 0:
-                    derived["power_factor_total"] = min(1.0, abs(active_power) / apparent_power)
-                else:
-                    derived["power_factor_total"] = 1.0
-            else:
-                derived["power_factor_total"] = 1.0
+        return values, meter_should_fail
+
+    def _calculate_derived_values(self, derived: dict[str, float]) -> None:
+        """Calculate derived values from basic measurements, in place.
+
+        Line-to-line voltages, phase powers and currents are never derived:
+        registers without a mapped entity keep their default value. Only the
+        total power factor is filled in from active and reactive power.
+        """
+        # Every register is present once defaults are applied, so index directly
+        active_power = derived["power_total"]
+        if active_power <= 0 or derived["power_factor_total"] != 0:
+            return
+
+        # Active power is positive here, so the apparent power is too and the
+        # ratio already lies in (0, 1] without clamping
+        reactive_power = derived["reactive_power_total"]
+        if reactive_power != 0:
+            derived["power_factor_total"] = active_power / math.hypot(active_power, reactive_power)
+        else:
+            derived["power_factor_total"] = 1.0
 
     def get_register_value(self, register_name: str) -> float | None:
-        """Get the current scaled value for a register."""
-        with self._state_lock:
-            return self._current_values.get(register_name)
+        """Get the current scaled value for a register.
+
+        Never raises: returns None for unknown registers and while no value is held.
+        """
+        index = REGISTER_INDEX.get(register_name)
+        return None if index is None else self._snapshot.values[index]
 
     def get_raw_register_value(self, register_name: str) -> int | None:
-        """Get the raw register value (as stored in Modbus)."""
-        with self._state_lock:
-            return self._raw_register_values.get(register_name)
+        """Get the raw register value (as stored in Modbus).
+
+        Never raises: returns None for unknown registers and while no value is held.
+        """
+        index = REGISTER_INDEX.get(register_name)
+        return None if index is None else self._snapshot.raw_values[index]
+
+    def get_all_register_values(self) -> dict[str, float | None]:
+        """Get the current scaled values of all registers from a single snapshot."""
+        return dict(zip(REGISTER_INDEX, self._snapshot.values))
+
+    @property
+    def register_values(self) -> tuple[float | None, ...]:
+        """Current scaled values of all registers, indexed by REGISTER_INDEX."""
+        return self._snapshot.values
+
+    @property
+    def raw_register_values(self) -> tuple[int | None, ...]:
+        """Raw Modbus values of all registers, indexed by REGISTER_INDEX."""
+        return self._snapshot.raw_values
+
+    @property
+    def snapshot(self) -> RegisterSnapshot:
+        """Scaled and raw values from the latest published update."""
+        return self._snapshot
 
     @property
     def is_running(self) -> bool:
@@ -504,5 +637,4 @@ class DTSU666ModbusServer:
     @property
     def is_meter_failed(self) -> bool:
         """Check if meter is in failed state."""
-        with self._state_lock:
-            return self._meter_failed
\ No newline at end of file
+        return self._meter_failed
\ No newline at end of file
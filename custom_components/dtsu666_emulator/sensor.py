@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.helpers.entity import EntityCategory
@@ -18,43 +19,171 @@ from homeassistant.const import (
     UnitOfFrequency,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, REGISTER_MAP
+from .const import DOMAIN, REGISTER_INDEX, REGISTER_MAP, REQUIRED_ENTITIES
+from .coordinator import DTSU666Coordinator
 from .modbus_server import DTSU666ModbusServer
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Sensor properties by register name prefix, checked in order so that
+# "power_factor" is matched before the plain "power" prefix
+_PROPERTIES_BY_PREFIX: dict[
+    str, tuple[SensorDeviceClass, str | None, SensorStateClass]
+] = {
+    "voltage": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, SensorStateClass.MEASUREMENT),
+    "current": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, SensorStateClass.MEASUREMENT),
+    "power_factor": (SensorDeviceClass.POWER_FACTOR, None, SensorStateClass.MEASUREMENT),
+    "reactive_power": (SensorDeviceClass.REACTIVE_POWER, "kVAr", SensorStateClass.MEASUREMENT),
+    "power": (SensorDeviceClass.POWER, UnitOfPower.KILO_WATT, SensorStateClass.MEASUREMENT),
+    "energy": (SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR, SensorStateClass.TOTAL_INCREASING),
+    "frequency": (SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ, SensorStateClass.MEASUREMENT),
+}
+
+
+def _classify_register(
+    register_name: str, unit: str
+) -> tuple[SensorDeviceClass | None, str | None, SensorStateClass]:
+    """Derive device class, unit and state class for a register from its name prefix."""
+    for prefix, properties in _PROPERTIES_BY_PREFIX.items():
+        if register_name.startswith(prefix):
+            return properties
+    return None, unit, SensorStateClass.MEASUREMENT
+
+
+# Display names for the register sensors; other registers fall back to a title-cased name
+_FRIENDLY_NAMES = {
+    "voltage_l1": "Voltage L1",
+    "voltage_l2": "Voltage L2",
+    "voltage_l3": "Voltage L3",
+    "voltage_l1_l2": "Voltage L1-L2",
+    "voltage_l2_l3": "Voltage L2-L3",
+    "voltage_l3_l1": "Voltage L3-L1",
+    "current_l1": "Current L1",
+    "current_l2": "Current L2",
+    "current_l3": "Current L3",
+    "current_neutral": "Current Neutral",
+    "power_l1": "Power L1",
+    "power_l2": "Power L2",
+    "power_l3": "Power L3",
+    "power_total": "Total Power",
+    "reactive_power_l1": "Reactive Power L1",
+    "reactive_power_l2": "Reactive Power L2",
+    "reactive_power_l3": "Reactive Power L3",
+    "reactive_power_total": "Total Reactive Power",
+    "power_factor_l1": "Power Factor L1",
+    "power_factor_l2": "Power Factor L2",
+    "power_factor_l3": "Power Factor L3",
+    "power_factor_total": "Total Power Factor",
+    "energy_import_total": "Total Energy Import",
+    "energy_export_total": "Total Energy Export",
+    "frequency": "Grid Frequency",
+}
+
+
+def _describe_register(register_name: str, unit: str) -> SensorEntityDescription:
+    """Build the static entity description for a register sensor."""
+    device_class, native_unit, state_class = _classify_register(register_name, unit)
+    friendly_name = _FRIENDLY_NAMES.get(
+        register_name, register_name.replace("_", " ").title()
+    )
+    return SensorEntityDescription(
+        key=register_name,
+        name=f"DTSU666 {friendly_name}",
+        device_class=device_class,
+        native_unit_of_measurement=native_unit,
+        state_class=state_class,
+    )
+
+
+# Registers are fixed, so build their descriptions once at import time
+SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
+    register_name: _describe_register(register_name, info.unit)
+    for register_name, info in REGISTER_MAP.items()
+}
+
+
+# Key registers shown by the summary sensor, with snapshot index, unit and formatted address
+_SUMMARY_REGISTERS = tuple(
+    (
+        register_name,
+        REGISTER_INDEX[register_name],
+        REGISTER_MAP[register_name].unit,
+        f"0x{REGISTER_MAP[register_name].addr:04X}",
+    )
+    for register_name in (
+        "power_total",
+        "voltage_l1",
+        "frequency",
+        "current_l1",
+        "energy_import_total",
+        "energy_export_total",
+    )
+)
+
+
+# Source entity states that carry no measurement
+_UNAVAILABLE_STATES = frozenset({"unknown", "unavailable"})
+
+
+def _status_of(state: State | None) -> str:
+    """Classify the state of a mapped required entity."""
+    if not state:
+        return "entity_not_found"
+    if state.state in _UNAVAILABLE_STATES:
+        return "unavailable"
+    try:
+        float(state.state)
+    except (ValueError, TypeError):
+        return "invalid_value"
+    return "ok"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up DTSU666 Emulator sensor entities."""
-    server: DTSU666ModbusServer = hass.data[DOMAIN][config_entry.entry_id]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    server: DTSU666ModbusServer = entry_data["server"]
+    coordinator: DTSU666Coordinator = entry_data["coordinator"]
     entity_mappings = config_entry.data.get("entity_mappings", {})
+
+    # All entities of this entry belong to the same emulated meter device
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name="DTSU666 Emulator",
+        manufacturer="CHINT (Emulated)",
+        model="DTSU666-FE",
+        sw_version="1.0.0",
+    )
     
     # Create diagnostic sensors for ALL registers (mapped + defaults)
-    sensors = []
-    for register_name in REGISTER_MAP.keys():
-        source_entity = entity_mappings.get(register_name, "default")
-        sensors.append(
-            DTSU666RegisterSensor(
-                server=server,
-                config_entry=config_entry,
-                register_name=register_name,
-                source_entity=source_entity,
-            )
+    mappings_get = entity_mappings.get
+    sensors: list[SensorEntity] = [
+        DTSU666RegisterSensor(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            device_info=device_info,
+            register_name=register_name,
+            source_entity=mappings_get(register_name, "default"),
         )
+        for register_name in REGISTER_MAP
+    ]
     
     # Add server status sensor
     sensors.append(
         DTSU666ServerStatusSensor(
             server=server,
             config_entry=config_entry,
+            device_info=device_info,
         )
     )
     
@@ -63,129 +192,87 @@ async def async_setup_entry(
         DTSU666SummarySensor(
             server=server,
             config_entry=config_entry,
+            device_info=device_info,
         )
     )
     
-    async_add_entities(sensors)
+    # The coordinator already holds its first snapshot, so skip per-entity updates on add
+    async_add_entities(sensors, False)
 
 
-class DTSU666RegisterSensor(SensorEntity):
+class DTSU666RegisterSensor(CoordinatorEntity[DTSU666Coordinator], SensorEntity):
     """Sensor that shows the actual register value being sent via Modbus."""
 
     def __init__(
         self,
-        server: DTSU666ModbusServer,
+        coordinator: DTSU666Coordinator,
         config_entry: ConfigEntry,
+        device_info: DeviceInfo,
         register_name: str,
         source_entity: str,
     ) -> None:
         """Initialize the sensor."""
-        self._server = server
+        super().__init__(coordinator)
+        self._server = coordinator.server
         self._config_entry = config_entry
         self._register_name = register_name
         self._source_entity = source_entity
-        self._register_info = REGISTER_MAP[register_name]
+        self._register_index = REGISTER_INDEX[register_name]
+        # Static attribute values, formatted once instead of on every state read
+        register_info = REGISTER_MAP[register_name]
+        self._addr_hex = f"0x{register_info.addr:04X}"
+        self._scale = register_info.scale
+        self._attr_cache: tuple[int, State | None, dict[str, Any]] | None = None
         
+        # Name, device class, unit and state class come from the shared description
+        self.entity_description = SENSOR_DESCRIPTIONS[register_name]
+
         # Generate unique ID
         self._attr_unique_id = f"{config_entry.entry_id}_{register_name}_register"
-        friendly_name = self._get_friendly_name(register_name)
-        self._attr_name = f"DTSU666 {friendly_name}"
         
         self._attr_entity_registry_enabled_default = True
         
-        # Set device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name="DTSU666 Emulator",
-            manufacturer="CHINT (Emulated)",
-            model="DTSU666-FE",
-            sw_version="1.0.0",
-        )
-        
-        # Set sensor properties based on register type
-        self._setup_sensor_properties()
-
-    def _get_friendly_name(self, register_name: str) -> str:
-        """Get a friendly display name for the register."""
-        name_map = {
-            "voltage_l1": "Voltage L1",
-            "voltage_l2": "Voltage L2", 
-            "voltage_l3": "Voltage L3",
-            "voltage_l1_l2": "Voltage L1-L2",
-            "voltage_l2_l3": "Voltage L2-L3",
-            "voltage_l3_l1": "Voltage L3-L1",
-            "current_l1": "Current L1",
-            "current_l2": "Current L2",
-            "current_l3": "Current L3",
-            "current_neutral": "Current Neutral",
-            "power_l1": "Power L1",
-            "power_l2": "Power L2",
-            "power_l3": "Power L3",
-            "power_total": "Total Power",
-            "reactive_power_l1": "Reactive Power L1",
-            "reactive_power_l2": "Reactive Power L2",
-            "reactive_power_l3": "Reactive Power L3",
-            "reactive_power_total": "Total Reactive Power",
-            "power_factor_l1": "Power Factor L1",
-            "power_factor_l2": "Power Factor L2",
-            "power_factor_l3": "Power Factor L3",
-            "power_factor_total": "Total Power Factor",
-            "energy_import_total": "Total Energy Import",
-            "energy_export_total": "Total Energy Export",
-            "frequency": "Grid Frequency",
-        }
-        return name_map.get(register_name, register_name.replace('_', ' ').title())
+        self._attr_device_info = device_info
 
-    def _setup_sensor_properties(self) -> None:
-        """Set up sensor properties based on register type."""
-        unit = self._register_info.get("unit", "")
-        
-        # Set device class and unit
-        if "voltage" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.VOLTAGE
-            self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "current" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.CURRENT
-            self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "power_factor" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.POWER_FACTOR
-            self._attr_native_unit_of_measurement = None
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "reactive_power" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.REACTIVE_POWER
-            self._attr_native_unit_of_measurement = "kVAr"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "power" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "energy" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        elif "frequency" in self._register_name:
-            self._attr_device_class = SensorDeviceClass.FREQUENCY
-            self._attr_native_unit_of_measurement = UnitOfFrequency.HERTZ
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        else:
-            self._attr_native_unit_of_measurement = unit
-            self._attr_state_class = SensorStateClass.MEASUREMENT
+    async def async_added_to_hass(self) -> None:
+        """Refresh the source entity attributes whenever the source entity changes."""
+        await super().async_added_to_hass()
+        if self._source_entity != "default":
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, [self._source_entity], self._async_on_source_change
+                )
+            )
+
+    @callback
+    def _async_on_source_change(self, event: Event) -> None:
+        """Write state so the new source entity state shows up in the attributes."""
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> float | None:
         """Return the current register value."""
-        return self._server.get_register_value(self._register_name)
+        return self.coordinator.data.values[self._register_index]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        raw_value = self._server.get_raw_register_value(self._register_name)
+        # Attributes only change with a register update or a new source entity state
+        snapshot = self.coordinator.data
+        seq = snapshot.seq
+        state = None
+        if self.hass and self._source_entity != "default":
+            state = self.hass.states.get(self._source_entity)
+        cached = self._attr_cache
+        if cached is not None and cached[0] == seq and cached[1] is state:
+            return cached[2]
+
+        # Read from the same snapshot as native_value so value and raw never disagree
+        raw_value = snapshot.raw_values[self._register_index]
             
         attributes = {
-            "register_address": f"0x{self._register_info['addr']:04X}",
-            "register_scale": self._register_info["scale"],
+            "register_address": self._addr_hex,
+            "register_scale": self._scale,
             "source_entity": self._source_entity if self._source_entity != "default" else "Default Value",
             "raw_register_value": raw_value,
             "modbus_hex": f"0x{raw_value:04X}" if raw_value is not None else None,
@@ -196,18 +283,17 @@ class DTSU666RegisterSensor(SensorEntity):
             attributes["data_source"] = "Calculated/Default"
         else:
             attributes["data_source"] = "Mapped Entity"
-            if self.hass and self._source_entity != "default":
-                state = self.hass.states.get(self._source_entity)
-                if state:
-                    attributes["source_entity_state"] = state.state
-                    attributes["source_entity_unit"] = state.attributes.get("unit_of_measurement", "")
-                
+            if state:
+                attributes["source_entity_state"] = state.state
+                attributes["source_entity_unit"] = state.attributes.get("unit_of_measurement", "")
+
+        self._attr_cache = (seq, state, attributes)
         return attributes
 
     @property
     def available(self) -> bool:
         """Return if sensor is available."""
-        return self._server.is_running
+        return super().available and self._server.is_running
 
 
 class DTSU666ServerStatusSensor(SensorEntity):
@@ -217,6 +303,7 @@ class DTSU666ServerStatusSensor(SensorEntity):
         self,
         server: DTSU666ModbusServer,
         config_entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         self._server = server
@@ -225,16 +312,11 @@ class DTSU666ServerStatusSensor(SensorEntity):
         self._attr_unique_id = f"{config_entry.entry_id}_server_status"
         self._attr_name = "DTSU666 Server Status"
         self._attr_icon = "mdi:server-network"
+        self._status_cache: tuple[tuple[State | None, ...], dict[str, str]] | None = None
         
         self._attr_entity_registry_enabled_default = True
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name="DTSU666 Emulator",
-            manufacturer="CHINT (Emulated)",
-            model="DTSU666-FE", 
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> str:
@@ -266,27 +348,25 @@ class DTSU666ServerStatusSensor(SensorEntity):
     def _get_required_entities_status(self) -> dict[str, str]:
         """Get status of required entities."""
         entity_mappings = self._config_entry.data.get("entity_mappings", {})
-        status = {}
-        
-        from .const import REQUIRED_ENTITIES
-        for required_entity_type in REQUIRED_ENTITIES:
-            entity_id = entity_mappings.get(required_entity_type)
-            if not entity_id:
-                status[required_entity_type] = "not_mapped"
-                continue
-                
-            state = self.hass.states.get(entity_id)
-            if not state:
-                status[required_entity_type] = "entity_not_found"
-            elif state.state in ("unknown", "unavailable"):
-                status[required_entity_type] = "unavailable"
-            else:
-                try:
-                    float(state.state)
-                    status[required_entity_type] = "ok"
-                except (ValueError, TypeError):
-                    status[required_entity_type] = "invalid_value"
-        
+        mappings_get = entity_mappings.get
+        states_get = self.hass.states.get
+
+        entity_ids = [mappings_get(entity_type) for entity_type in REQUIRED_ENTITIES]
+        states = tuple(states_get(entity_id) if entity_id else None for entity_id in entity_ids)
+
+        # HA replaces State objects on every change, so identical objects mean identical
+        # status; compare by identity to avoid State.__eq__ walking attributes and context
+        cached = self._status_cache
+        if cached is not None and all(
+            cached_state is state for cached_state, state in zip(cached[0], states)
+        ):
+            return cached[1]
+
+        status = {
+            required_entity_type: _status_of(state) if entity_id else "not_mapped"
+            for required_entity_type, entity_id, state in zip(REQUIRED_ENTITIES, entity_ids, states)
+        }
+        self._status_cache = (states, status)
         return status
 
     @property
@@ -302,6 +382,7 @@ class DTSU666SummarySensor(SensorEntity):
         self,
         server: DTSU666ModbusServer,
         config_entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         self._server = server
@@ -313,50 +394,40 @@ class DTSU666SummarySensor(SensorEntity):
         
         self._attr_entity_registry_enabled_default = True
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name="DTSU666 Emulator",
-            manufacturer="CHINT (Emulated)",
-            model="DTSU666-FE", 
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> str:
         """Return the summary status."""
         total_registers = len(REGISTER_MAP)
-        active_registers = len([v for v in [
-            self._server.get_register_value(name) for name in REGISTER_MAP.keys()
-        ] if v is not None and v != 0])
+        # None (no value yet) and 0.0 both count as inactive
+        active_registers = sum(1 for value in self._server.register_values if value)
         
         return f"{active_registers}/{total_registers} registers active"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return summary of all register values."""
+        # Read each snapshot once so every attribute comes from the same update
+        values = self._server.register_values
+        raw_values = self._server.raw_register_values
+
         summary = {}
-        key_registers = ["power_total", "voltage_l1", "frequency", "current_l1", "energy_import_total", "energy_export_total"]
-        
-        for register_name in key_registers:
-            value = self._server.get_register_value(register_name)
-            raw_value = self._server.get_raw_register_value(register_name)
+        for register_name, index, unit, addr_hex in _SUMMARY_REGISTERS:
+            value = values[index]
+            raw_value = raw_values[index]
             
             if value is not None:
-                unit = REGISTER_MAP[register_name].get("unit", "")
                 summary[f"{register_name}_value"] = f"{value:.3f} {unit}".strip()
                 summary[f"{register_name}_raw"] = raw_value
-                summary[f"{register_name}_address"] = f"0x{REGISTER_MAP[register_name]['addr']:04X}"
+                summary[f"{register_name}_address"] = addr_hex
             else:
                 summary[f"{register_name}_value"] = "N/A"
         
         # Add non-zero register count
-        all_values = {}
-        for register_name in REGISTER_MAP.keys():
-            value = self._server.get_register_value(register_name)
-            if value is not None and value != 0:
-                all_values[register_name] = value
-                
-        summary["active_registers"] = list(all_values.keys())
+        summary["active_registers"] = [
+            register_name for register_name, value in zip(REGISTER_INDEX, values) if value
+        ]
         summary["total_registers"] = len(REGISTER_MAP)
         summary["meter_status"] = "failed" if self._server.is_meter_failed else "running"
         
@@ -1,42 +1,86 @@
 """Utility functions for DTSU666 Emulator integration."""
 from __future__ import annotations
 
-import ipaddress
 import logging
+import re
+import socket
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from .const import REQUIRED_ENTITIES
+from .const import CONF_ENTITY_MAPPINGS, ENTITY_MAPPING_TYPES, REQUIRED_ENTITIES
 
 _LOGGER = logging.getLogger(__name__)
 
+_TRIVIAL_HOSTS = frozenset({"0.0.0.0", "localhost", "::"})
+
+# Dotted-quad shape only; inet_pton still checks the octet ranges
+_IPV4_SHAPE_RE = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}\Z")
+
+# Prefix of the entity mapping fields in the config/options forms
+_EM_PREFIX = f"{CONF_ENTITY_MAPPINGS}."
+_EM_PREFIX_LEN = len(_EM_PREFIX)
+
 
 def is_valid_host(host: str) -> bool:
     """Validate host address."""
-    if host in ("0.0.0.0", "localhost"):
+    if host in _TRIVIAL_HOSTS:
         return True
-    
+
+    # Pick the one address family the string can be, so non-addresses fail without raising
+    if ":" in host:
+        family = socket.AF_INET6
+        # inet_pton does not understand IPv6 scope IDs such as fe80::1%eth0
+        host, sep, scope_id = host.partition("%")
+        if sep and (not scope_id or "%" in scope_id or "/" in scope_id):
+            return False
+    elif _IPV4_SHAPE_RE.match(host):
+        family = socket.AF_INET
+    else:
+        return False
+
     try:
-        ipaddress.ip_address(host)
-        return True
-    except ValueError:
+        socket.inet_pton(family, host)
+    except (OSError, ValueError):
+        # ValueError is raised for strings with embedded NUL characters
         return False
+    return True
+
+
+# Device class by entity type prefix; reactive power entities do not start with
+# "power" but still select power sensors (power factor ones already match "power")
+_DEVICE_CLASS_BY_PREFIX = {
+    "voltage": "voltage",
+    "current": "current",
+    "reactive_power": "power",
+    "power": "power",
+    "energy": "energy",
+    "frequency": "frequency",
+}
+
+
+def _classify_device_class(entity_type: str) -> str | None:
+    """Derive the device class for an entity type from its name prefix."""
+    for prefix, device_class in _DEVICE_CLASS_BY_PREFIX.items():
+        if entity_type.startswith(prefix):
+            return device_class
+    return None
+
+
+# Entity types are fixed, so resolve their device classes once at import time
+_DEVICE_CLASS_MAP: dict[str, str | None] = {
+    entity_type: _classify_device_class(entity_type)
+    for entity_type in ENTITY_MAPPING_TYPES
+}
 
 
 def get_device_class_for_entity(entity_type: str) -> str | None:
     """Get device class for entity type."""
-    if "voltage" in entity_type:
-        return "voltage"
-    elif "current" in entity_type:
-        return "current"
-    elif "power" in entity_type:
-        return "power"
-    elif "energy" in entity_type:
-        return "energy"
-    elif "frequency" in entity_type:
-        return "frequency"
-    return None
+    try:
+        return _DEVICE_CLASS_MAP[entity_type]
+    except KeyError:
+        # Other names (e.g. line-to-line voltages) are classified on demand
+        return _classify_device_class(entity_type)
 
 
 def validate_network_settings(user_input: dict[str, Any]) -> dict[str, str]:
@@ -74,10 +118,12 @@ def validate_entity_mappings(
         return errors
     
     # Validate entity IDs exist
-    invalid_entities = []
-    for entity_type, entity_id in entity_mappings.items():
-        if entity_id and not hass.states.get(entity_id):
-            invalid_entities.append(f"{entity_type}: {entity_id}")
+    states_get = hass.states.get
+    invalid_entities = [
+        f"{entity_type}: {entity_id}"
+        for entity_type, entity_id in entity_mappings.items()
+        if entity_id and not states_get(entity_id)
+    ]
     
     if invalid_entities:
         errors["base"] = "invalid_entities"
@@ -88,14 +134,9 @@ def validate_entity_mappings(
 
 def parse_entity_mappings(user_input: dict[str, Any]) -> dict[str, str]:
     """Parse entity mappings from form data."""
-    from .const import CONF_ENTITY_MAPPINGS
-    
-    entity_mappings = {}
-    for key, value in user_input.items():
-        if key.startswith(f"{CONF_ENTITY_MAPPINGS}."):
-            entity_type = key.replace(f"{CONF_ENTITY_MAPPINGS}.", "")
-            # Only add non-empty values to mappings
-            if value and value.strip():
-                entity_mappings[entity_type] = value.strip()
-    
-    return entity_mappings
\ No newline at end of file
+    # Only add non-empty values to mappings
+    return {
+        key[_EM_PREFIX_LEN:]: stripped
+        for key, value in user_input.items()
+        if key.startswith(_EM_PREFIX) and isinstance(value, str) and (stripped := value.strip())
+    }
\ No newline at end of file